@@ -30,6 +30,10 @@ setup(
     package_dir={"": "src"},
     test_suite="tests",
     install_requires=[],
+    extras_require={
+        "re2": ["google-re2"],
+        "pcre": ["pcre2"],
+    },
     keywords="",
     classifiers=[
         "License :: OSI Approved :: MIT License",
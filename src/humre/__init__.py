@@ -7,12 +7,7 @@ A human-readable regular expression module for Python."""
 # TODO - Add inline flags like '(?i)'
 
 import re, itertools, functools
-
-
-try:
-    from typing import ParamSpecArgs
-except ImportError:
-    pass  # Do nothing if run with a version of Python that doesn't have type hints.
+import operator as _operator, sys as _sys, warnings as _warnings  # Aliased so "from humre import *" doesn't export them.
 
 __version__ = '0.1.4'
 
@@ -28,6 +23,10 @@ BOUNDARY = r'\b'
 
 
 # Constants copied from the re module:
+# These are plain assignments (not looked up lazily with a module
+# __getattr__) so that `from humre import *` includes them. Copying them
+# costs nothing extra at import time, since the re module is already
+# fully loaded by the time these lines run.
 # Changed in version 3.6: Flag constants are now instances of RegexFlag, which is a subclass of enum.IntFlag.
 A = re.A
 ASCII = re.ASCII
@@ -174,6 +173,47 @@ BACK_8 = r'\8'
 BACK_9 = r'\9'
 
 
+def _check_nonneg_int(value, name):  # type: (int, str) -> int
+    # Returns value as an int, or raises an exception if value, the argument
+    # named name, isn't an int of 0 or more. operator.index() accepts any
+    # int-like type (such as numpy integers) but not floats. Bools are
+    # rejected even though they're a subclass of int.
+    if type(value) is int and value >= 0:
+        return value  # The common case, checked first because it's cheap.
+    if type(value) is bool:
+        raise TypeError(name + ' argument must be a positive int, not bool')
+    try:
+        value = _operator.index(value)
+    except TypeError:
+        raise TypeError(name + ' argument must be a positive int, not ' + type(value).__qualname__) from None
+    if value < 0:
+        raise ValueError(name + ' argument must be a positive int, not ' + str(value))
+    return value
+
+
+# between() suffixes like '{2,5}' take two str() calls and four
+# concatenations to build from the same few small numbers over and over,
+# so they're cached here.
+_BETWEEN_SUFFIX_CACHE = {}  # type: dict
+_BETWEEN_SUFFIX_CACHE_MAX = 1024
+
+
+def _between_suffix(minimum, maximum):  # type: (int, int) -> str
+    # Returns the regex quantifier suffix for between minimum and maximum
+    # occurrences, such as '{2,5}'.
+    try:
+        return _BETWEEN_SUFFIX_CACHE[minimum, maximum]
+    except KeyError:
+        pass
+
+    suffix = '{' + str(minimum) + ',' + str(maximum) + '}'
+    # Only store plain ints. True == 1 and hash(True) == hash(1), so a bool
+    # key would otherwise hand out '{True,...}' for an int argument.
+    if type(minimum) is int and type(maximum) is int and len(_BETWEEN_SUFFIX_CACHE) < _BETWEEN_SUFFIX_CACHE_MAX:
+        _BETWEEN_SUFFIX_CACHE[minimum, maximum] = suffix
+    return suffix
+
+
 def back_reference(group_number):  # type: (int) -> str
     r"""Returns a string in the regex syntax for a back reference, such as
     \1, \2, etc.
@@ -201,9 +241,50 @@ def join(*strs):  # type: (str) -> str
     return ''.join(strs)
 
 
+def build(*parts):  # type: (str) -> str
+    r"""Returns a concatenated string of the strings in parts, which can
+    also contain tuples and lists of strings nested to any depth. Nested
+    builder calls like group('cat', group('dog')) create a new string at
+    every level, while build() joins all of the strings only once at the
+    end, which is faster for very deeply nested patterns.
+
+    >>> from humre import *
+    >>> build('(', 'cat', ('(', 'dog', ')'), ('(', 'moose', ')'), ')')
+    '(cat(dog)(moose))'
+    >>> build(['a', ['b', ['c']]], 'd')
+    'abcd'
+    """
+    return ''.join(_flatten(parts))
+
+
+def _flatten(parts):  # type: (tuple) -> object
+    # Yields the strings in parts in order, going into nested tuples and
+    # lists. This uses a stack instead of recursion so that deeply nested
+    # parts can't hit the recursion limit.
+    stack = [iter(parts)]
+    while stack:
+        for part in stack[-1]:
+            if isinstance(part, (tuple, list)):
+                stack.append(iter(part))
+                break
+            yield part
+        else:
+            stack.pop()
+
+
+# The same translation table that re.escape() uses (in Python 3.7 and later)
+# to put a backslash in front of each special character. Before 3.7,
+# re.escape() escaped every non-alphanumeric character, so the table is None
+# on those versions and esc() calls re.escape() directly instead.
+if _sys.version_info < (3, 7):
+    _ESCAPE_TABLE = None
+else:
+    _ESCAPE_TABLE = {ord(c): '\\' + c for c in '()[]{}?*+-|^$\\.&~# \t\n\r\v\f'}
+
+
 def esc(*regex_strs):  # type: (str) -> str
-    r"""A wrapper for re.escape(). Escapes special characters in the strings
-    in regex_strs.
+    r"""Escapes special characters in the strings in regex_strs, the same way
+    that re.escape() does.
 
     >>> from humre import *
     >>> esc('!#$%&')
@@ -213,20 +294,163 @@ def esc(*regex_strs):  # type: (str) -> str
     >>> re.escape('!#$%&') == esc('!#$%&')
     True
     """
-    return re.escape(''.join(regex_strs))
+    if _ESCAPE_TABLE is None:
+        return re.escape(''.join(regex_strs))
+    return ''.join(regex_strs).translate(_ESCAPE_TABLE)
 
 
-def compile(*regex_strs, flags=0):  # TODO fix type hint
+def compile(*regex_strs, flags=0, engine='stdlib'):  # TODO fix type hint
     """A wrapper for re.compile(). This passes the strings in regex_strs
     as a single concatenated string to re.compile(). All other arguments to
     re.compile() must be passed to the flags keyword argument.
 
+    Pass engine='re2' to compile the pattern with Google's RE2 engine
+    instead (this requires the google-re2 package). RE2 never backtracks,
+    so matching takes linear time even for patterns that would be
+    pathologically slow with the re module. RE2 doesn't support back
+    references, lookaheads, lookbehinds, or the ASCII, LOCALE, VERBOSE,
+    and DEBUG flags. For those patterns, compile() gives a warning and
+    returns a re.Pattern object instead. Some patterns compile but match
+    differently in RE2: \\d, \\w, \\s, and \\b only match ASCII characters,
+    and $ doesn't match before a newline at the end of the string.
+
+    Pass engine='pcre-jit' to compile the pattern with PCRE2 and its JIT
+    compiler, which turns the pattern into machine code (this requires the
+    pcre2 package). PCRE2 supports back references and lookarounds, and
+    its Pattern objects have the same search(), match(), findall(), sub(),
+    and other methods as re.Pattern. PCRE2 doesn't support the LOCALE and
+    DEBUG flags.
+
     >>> from humre import *
     >>> patternObj = compile('[a-z]+', flags=IGNORECASE)
     >>> patternObj.search('Hello')
     <re.Match object; span=(0, 5), match='Hello'>
     """
-    return re.compile(''.join(regex_strs), flags=flags)
+    if engine not in _ENGINES:
+        raise ValueError('engine argument must be one of ' + ', '.join(repr(e) for e in _ENGINES) + ', not ' + repr(engine)[:100])
+    regexStr = ''.join(regex_strs)
+    # Use a plain int for flags: the & below and the cache's hashing of the
+    # key are much slower on RegexFlag enum values than on ints.
+    flags = int(flags)
+    if flags & _RE_DEBUG and engine == 'stdlib':
+        # re.DEBUG prints debug info as a side effect of compiling, so don't cache it. (The re module doesn't either.)
+        return re.compile(regexStr, flags=flags)
+    return _cached_compile(regexStr, flags, engine)
+
+
+_ENGINES = ('stdlib', 're2', 'pcre-jit')
+_RE_DEBUG = int(re.DEBUG)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_compile(regex_str, flags, engine):  # type: (str, int, str) -> object
+    # Humre code tends to build the same regex strings over and over, so
+    # keep the compiled Pattern objects around. Pattern objects are
+    # immutable, so it's safe to hand the same one out to every caller.
+    if engine == 're2':
+        return _compile_re2(regex_str, flags)
+    if engine == 'pcre-jit':
+        return _compile_pcre_jit(regex_str, flags)
+    return re.compile(regex_str, flags=flags)
+
+
+def _fallback_compile(problem, regex_str, flags):  # type: (str, str, int) -> re.Pattern
+    # Warns about why the requested engine can't compile regex_str, then
+    # compiles it with the re module.
+    _warnings.warn(problem + ', so this pattern was compiled with the re module instead.', stacklevel=5)
+    return re.compile(regex_str, flags=flags)
+
+
+# RE2 has no flags argument, but it does support these as inline flags.
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _compile_re2(regex_str, flags):  # type: (str, int) -> object
+    try:
+        import re2
+    except ImportError:
+        raise ImportError("engine='re2' requires the google-re2 package, which you can install with: pip install google-re2")
+
+    inlineFlags = ''
+    unsupportedFlags = flags & ~re.UNICODE  # RE2 is always Unicode-aware.
+    for flag, letter in _RE2_INLINE_FLAGS:
+        if flags & flag:
+            inlineFlags += letter
+            unsupportedFlags &= ~flag
+    if unsupportedFlags:
+        return _fallback_compile('RE2 does not support the flags ' + repr(re.RegexFlag(unsupportedFlags)), regex_str, flags)
+
+    options = re2.Options()
+    options.log_errors = False  # Otherwise RE2 also logs every failed pattern to stderr.
+    try:
+        return re2.compile(('(?' + inlineFlags + ')' if inlineFlags else '') + regex_str, options=options)
+    except re2.error as exc:
+        message = exc.args[0] if exc.args else ''
+        if isinstance(message, bytes):
+            message = message.decode('utf-8', 'replace')
+        return _fallback_compile('RE2 cannot compile this pattern (' + str(message) + ')', regex_str, flags)
+
+
+# The re flags that PCRE2 also has, and the names of the pcre2 module's
+# equivalents. (The pcre2 module's flags have different values.)
+_PCRE_FLAGS = ((re.IGNORECASE, 'IGNORECASE'), (re.MULTILINE, 'MULTILINE'), (re.DOTALL, 'DOTALL'), (re.VERBOSE, 'VERBOSE'), (re.ASCII, 'ASCII'))
+
+
+def _compile_pcre_jit(regex_str, flags):  # type: (str, int) -> object
+    try:
+        import pcre2
+    except ImportError:
+        raise ImportError("engine='pcre-jit' requires the pcre2 package, which you can install with: pip install pcre2")
+
+    pcreFlags = 0
+    unsupportedFlags = flags & ~re.UNICODE  # Like re, PCRE2 str patterns are Unicode-aware by default.
+    for flag, name in _PCRE_FLAGS:
+        if flags & flag:
+            pcreFlags |= getattr(pcre2, name)
+            unsupportedFlags &= ~flag
+    if unsupportedFlags:
+        return _fallback_compile('PCRE2 does not support the flags ' + repr(re.RegexFlag(unsupportedFlags)), regex_str, flags)
+
+    try:
+        return pcre2.compile(regex_str, pcreFlags, jit=True)
+    except pcre2.error as exc:
+        return _fallback_compile('PCRE2 cannot compile this pattern (' + str(exc) + ')', regex_str, flags)
+
+
+compile.cache_clear = _cached_compile.cache_clear
+
+
+class _Patterns:
+    """Compiled re.Pattern objects for Humre's character class and pattern
+    constants, such as patterns.LETTER for compile(LETTER). The large
+    Unicode character classes are slow to compile, so each one is compiled
+    the first time it is used and then kept.
+
+    >>> from humre import *
+    >>> patterns.LETTER.match('cat')
+    <re.Match object; span=(0, 1), match='c'>
+    """
+
+    _NAMES = (
+        'LETTER', 'NONLETTER', 'UPPERCASE', 'NONUPPERCASE', 'LOWERCASE', 'NONLOWERCASE',
+        'ALPHANUMERIC', 'NONALPHANUMERIC', 'NUMERIC', 'NONNUMERIC', 'HEXADECIMAL', 'NONHEXADECIMAL',
+        'NUMBER', 'EURO_NUMBER', 'HEXADECIMAL_NUMBER',
+    )
+
+    def __getattr__(self, name):  # type: (str) -> re.Pattern
+        if name not in _Patterns._NAMES:
+            raise AttributeError('humre.patterns has no attribute ' + repr(name))
+        # Going through compile() also puts the pattern in compile()'s cache,
+        # so compile(LETTER) returns this same object while it stays cached.
+        patternObj = compile(globals()[name])
+        setattr(self, name, patternObj)
+        return patternObj
+
+    def __dir__(self):
+        return list(_Patterns._NAMES)
+
+
+patterns = _Patterns()
 
 
 def group(*regex_strs):  # type: (str) -> str
@@ -340,12 +564,12 @@ def named_group(name, *regex_strs):  # type: (str, str) -> str
     >>> from humre import *
     >>> named_group('group_name', 'pattern_to_look_for')
     '(?P<group_name>pattern_to_look_for)'
-    >>> named_group('pobox', r'PO BOX \d{3:5}')
-    '(?P<pobox>PO BOX \\d{3:5})'
+    >>> named_group('pobox', r'PO BOX \d{3,5}')
+    '(?P<pobox>PO BOX \\d{3,5})'
     """
     if not isinstance(name, str):
         raise TypeError('name argument must be a str, not ' + type(name).__qualname__)
-    if re.match(r'\w+', name) is None or re.match(r'^\d', name):
+    if not name.isidentifier():  # This is the same rule that the re module uses for group names.
         raise ValueError('name must contain only letters, numbers, and underscore and not start with a number, not ' + repr(name)[:100])
     return '(?P<' + str(name) + '>' + ''.join(regex_strs) + ')'
 
@@ -382,6 +606,10 @@ def optional(*regex_strs):  # type: (str) -> str
     return regexStr + '?'
 
 
+# Skips only blank strings, so that str.join() still rejects non-str arguments like None.
+_is_not_blank = functools.partial(_operator.ne, '')
+
+
 # TODO - it's going to be really easy to get this wrong when people pass multiple comma-separated arguments when they intended to pass fewer string arguments in. How do we avoid this problem?
 def either(*regex_strs):  # type: (str) -> str
     r"""Returns a string in the regex syntax for the alternation or "or"
@@ -392,10 +620,10 @@ def either(*regex_strs):  # type: (str) -> str
     >>> either(group('cat'), group('dog'), group('moose'))
     '(cat)|(dog)|(moose)'
     """
-    regex_strs = tuple([s for s in regex_strs if s != ''])
-    if len(regex_strs) == 0:
+    regexStr = '|'.join(filter(_is_not_blank, regex_strs))
+    if regexStr == '':
         raise ValueError('regex_strs argument must have at least one nonblank value')
-    return '|'.join(regex_strs)
+    return regexStr
 
 
 def exactly(quantity, *regex_strs):  # type: (int, str) -> str
@@ -408,10 +636,7 @@ def exactly(quantity, *regex_strs):  # type: (int, str) -> str
     >>> compile(exactly(3, 'a')).search('aaaaah!')
     <re.Match object; span=(0, 3), match='aaa'>
     """
-    if not isinstance(quantity, int):
-        raise TypeError('quantity argument must be a positive int, not ' + type(quantity).__qualname__)
-    if quantity < 0:
-        raise ValueError('quantity argument must be a positive int, not ' + str(quantity))
+    quantity = _check_nonneg_int(quantity, 'quantity')
     regexStr = ''.join(regex_strs)
     if regexStr == '':
         raise ValueError('regex_strs argument must have at least one nonblank value')
@@ -427,20 +652,14 @@ def between(minimum, maximum, *regex_strs):  # type: (int, int, str) -> str
     >>> between(3, 5, 'abc')
     'abc{3,5}'
     """
-    if not isinstance(minimum, int):
-        raise TypeError('minimum argument must be a positive int, not ' + type(minimum).__qualname__)
-    if minimum < 0:
-        raise ValueError('minimum argument must be a positive int, not ' + str(minimum))
-    if not isinstance(maximum, int):
-        raise TypeError('maximum argument must be a positive int, not ' + type(maximum).__qualname__)
-    if maximum < 0:
-        raise ValueError('maximum argument must be a positive int, not ' + str(maximum))
+    minimum = _check_nonneg_int(minimum, 'minimum')
+    maximum = _check_nonneg_int(maximum, 'maximum')
     if minimum > maximum:
         raise ValueError('minimum argument ' + str(minimum) + ' must be less than maximum argument ' + str(maximum))
     regexStr = ''.join(regex_strs)
     if regexStr == '':
         raise ValueError('regex_strs argument must have at least one nonblank value')
-    return regexStr + '{' + str(minimum) + ',' + str(maximum) + '}'
+    return regexStr + _between_suffix(minimum, maximum)
 
 
 def at_least(minimum, *regex_strs):  # type: (int, str) -> str
@@ -451,10 +670,7 @@ def at_least(minimum, *regex_strs):  # type: (int, str) -> str
     >>> at_least(3, 'abc')
     'abc{3,}'
     """
-    if not isinstance(minimum, int):
-        raise TypeError('minimum argument must be a positive int, not ' + type(minimum).__qualname__)
-    if minimum < 0:
-        raise ValueError('minimum argument must be a positive int, not ' + str(minimum))
+    minimum = _check_nonneg_int(minimum, 'minimum')
     regexStr = ''.join(regex_strs)
     if regexStr == '':
         raise ValueError('regex_strs argument must have at least one nonblank value')
@@ -469,10 +685,7 @@ def at_most(maximum, *regex_strs):  # type: (int, str) -> str
     >>> at_most(3, 'abc')
     'abc{,3}'
     """
-    if not isinstance(maximum, int):
-        raise TypeError('maximum argument must be a positive int, not ' + type(maximum).__qualname__)
-    if maximum < 0:
-        raise ValueError('maximum argument must be a positive int, not ' + str(maximum))
+    maximum = _check_nonneg_int(maximum, 'maximum')
     regexStr = ''.join(regex_strs)
     if regexStr == '':
         raise ValueError('regex_strs argument must have at least one nonblank value')
@@ -491,7 +704,7 @@ def zero_or_more(*regex_strs):  # type: (str) -> str
     regexStr = ''.join(regex_strs)
     if regexStr == '':
         raise ValueError('regex_strs argument must have at least one nonblank value')
-    return ''.join(regex_strs) + '*'
+    return regexStr + '*'
 
 
 def zero_or_more_lazy(*regex_strs):  # type: (str) -> str
@@ -634,8 +847,7 @@ def group_either(*regex_strs):  # type: (str) -> str
     >>> group_either('a', 'b', 'c')
     '(a|b|c)'
     """
-    regex_strs = tuple([s for s in regex_strs if s != ''])
-    return '(' + '|'.join(regex_strs) + ')'
+    return '(' + either(*regex_strs) + ')'
 
 
 def noncap_group_either(*regex_strs):  # type: (str) -> str
@@ -647,8 +859,7 @@ def noncap_group_either(*regex_strs):  # type: (str) -> str
     >>> noncap_group_either('a', 'b', 'c')
     '(?:a|b|c)'
     """
-    regex_strs = tuple([s for s in regex_strs if s != ''])
-    return '(?:' + '|'.join(regex_strs) + ')'
+    return '(?:' + either(*regex_strs) + ')'
 
 
 def group_exactly(quantity, *regex_strs):  # type: (int, str) -> str
@@ -660,11 +871,7 @@ def group_exactly(quantity, *regex_strs):  # type: (int, str) -> str
     >>> group_exactly(3, 'abc')
     '(abc){3}'
     """
-    if not isinstance(quantity, int):
-        raise TypeError('quantity argument must be a positive int, not ' + type(quantity).__qualname__)
-    if quantity < 0:
-        raise ValueError('quantity argument must be a positive int, not ' + str(quantity))
-
+    quantity = _check_nonneg_int(quantity, 'quantity')
     return '(' + ''.join(regex_strs) + '){' + str(quantity) + '}'
 
 
@@ -677,11 +884,7 @@ def noncap_group_exactly(quantity, *regex_strs):  # type: (int, str) -> str
     >>> noncap_group_exactly(3, 'abc')
     '(?:abc){3}'
     """
-    if not isinstance(quantity, int):
-        raise TypeError('quantity argument must be a positive int, not ' + type(quantity).__qualname__)
-    if quantity < 0:
-        raise ValueError('quantity argument must be a positive int, not ' + str(quantity))
-
+    quantity = _check_nonneg_int(quantity, 'quantity')
     return '(?:' + ''.join(regex_strs) + '){' + str(quantity) + '}'
 
 
@@ -694,18 +897,11 @@ def group_between(minimum, maximum, *regex_strs):  # type: (int, int, str) -> st
     >>> group_between(3, 5, 'abc')
     '(abc){3,5}'
     """
-    if not isinstance(minimum, int):
-        raise TypeError('minimum argument must be a positive int, not ' + type(minimum).__qualname__)
-    if minimum < 0:
-        raise ValueError('minimum argument must be a positive int, not ' + str(minimum))
-    if not isinstance(maximum, int):
-        raise TypeError('maximum argument must be a positive int, not ' + type(maximum).__qualname__)
-    if maximum < 0:
-        raise ValueError('maximum argument must be a positive int, not ' + str(maximum))
+    minimum = _check_nonneg_int(minimum, 'minimum')
+    maximum = _check_nonneg_int(maximum, 'maximum')
     if minimum > maximum:
         raise ValueError('minimum argument ' + str(minimum) + ' must be less than maximum argument ' + str(maximum))
-
-    return '(' + ''.join(regex_strs) + '){' + str(minimum) + ',' + str(maximum) + '}'
+    return '(' + ''.join(regex_strs) + ')' + _between_suffix(minimum, maximum)
 
 
 def noncap_group_between(minimum, maximum, *regex_strs):  # type: (int, int, str) -> str
@@ -717,18 +913,11 @@ def noncap_group_between(minimum, maximum, *regex_strs):  # type: (int, int, str
     >>> noncap_group_between(3, 5, 'abc')
     '(?:abc){3,5}'
     """
-    if not isinstance(minimum, int):
-        raise TypeError('minimum argument must be a positive int, not ' + type(minimum).__qualname__)
-    if minimum < 0:
-        raise ValueError('minimum argument must be a positive int, not ' + str(minimum))
-    if not isinstance(maximum, int):
-        raise TypeError('maximum argument must be a positive int, not ' + type(maximum).__qualname__)
-    if maximum < 0:
-        raise ValueError('maximum argument must be a positive int, not ' + str(maximum))
+    minimum = _check_nonneg_int(minimum, 'minimum')
+    maximum = _check_nonneg_int(maximum, 'maximum')
     if minimum > maximum:
         raise ValueError('minimum argument ' + str(minimum) + ' must be less than maximum argument ' + str(maximum))
-
-    return '(?:' + ''.join(regex_strs) + '){' + str(minimum) + ',' + str(maximum) + '}'
+    return '(?:' + ''.join(regex_strs) + ')' + _between_suffix(minimum, maximum)
 
 
 def group_at_least(minimum, *regex_strs):  # type: (int, str) -> str
@@ -740,11 +929,7 @@ def group_at_least(minimum, *regex_strs):  # type: (int, str) -> str
     >>> group_at_least(3, 'abc')
     '(abc){3,}'
     """
-    if not isinstance(minimum, int):
-        raise TypeError('minimum argument must be a positive int, not ' + type(minimum).__qualname__)
-    if minimum < 0:
-        raise ValueError('minimum argument must be a positive int, not ' + str(minimum))
-
+    minimum = _check_nonneg_int(minimum, 'minimum')
     return '(' + ''.join(regex_strs) + '){' + str(minimum) + ',}'
 
 
@@ -757,11 +942,7 @@ def noncap_group_at_least(minimum, *regex_strs):  # type: (int, str) -> str
     >>> noncap_group_at_least(3, 'abc')
     '(?:abc){3,}'
     """
-    if not isinstance(minimum, int):
-        raise TypeError('minimum argument must be a positive int, not ' + type(minimum).__qualname__)
-    if minimum < 0:
-        raise ValueError('minimum argument must be a positive int, not ' + str(minimum))
-
+    minimum = _check_nonneg_int(minimum, 'minimum')
     return '(?:' + ''.join(regex_strs) + '){' + str(minimum) + ',}'
 
 
@@ -774,11 +955,7 @@ def group_at_most(maximum, *regex_strs):  # type: (int, str) -> str
     >>> group_at_most(3, 'abc')
     '(abc){,3}'
     """
-    if not isinstance(maximum, int):
-        raise TypeError('maximum argument must be a positive int, not ' + type(maximum).__qualname__)
-    if maximum < 0:
-        raise ValueError('maximum argument must be a positive int, not ' + str(maximum))
-
+    maximum = _check_nonneg_int(maximum, 'maximum')
     return '(' + ''.join(regex_strs) + '){,' + str(maximum) + '}'
 
 
@@ -791,11 +968,7 @@ def noncap_group_at_most(maximum, *regex_strs):  # type: (int, str) -> str
     >>> noncap_group_at_most(3, 'abc')
     '(?:abc){,3}'
     """
-    if not isinstance(maximum, int):
-        raise TypeError('maximum argument must be a positive int, not ' + type(maximum).__qualname__)
-    if maximum < 0:
-        raise ValueError('maximum argument must be a positive int, not ' + str(maximum))
-
+    maximum = _check_nonneg_int(maximum, 'maximum')
     return '(?:' + ''.join(regex_strs) + '){,' + str(maximum) + '}'
 
 
@@ -971,7 +1144,7 @@ def zero_or_more_possessive(*regex_strs):  # type: (str) -> str
     regexStr = ''.join(regex_strs)
     if regexStr == '':
         raise ValueError('regex_strs argument must have at least one nonblank value')
-    return ''.join(regex_strs) + '*+'
+    return regexStr + '*+'
 
 
 def one_or_more_possessive(*regex_strs):  # type: (str) -> str
@@ -981,7 +1154,7 @@ def one_or_more_possessive(*regex_strs):  # type: (str) -> str
     regexStr = ''.join(regex_strs)
     if regexStr == '':
         raise ValueError('regex_strs argument must have at least one nonblank value')
-    return ''.join(regex_strs) + '++'
+    return regexStr + '++'
 
 
 def optional_possessive(*regex_strs):  # type: (str) -> str
@@ -991,7 +1164,7 @@ def optional_possessive(*regex_strs):  # type: (str) -> str
     regexStr = ''.join(regex_strs)
     if regexStr == '':
         raise ValueError('regex_strs argument must have at least one nonblank value')
-    return ''.join(regex_strs) + '?+'
+    return regexStr + '?+'
 
 
 def inline_flag(flags, *regex_strs):  # type: (str, str) -> str
@@ -1060,6 +1233,14 @@ HEXADECIMAL_NUMBER = either(
     noncap_group(one_or_more(chars('0-9A-F'))),
 )
 
+# Intern all of the string constants above. Regex strings get built out of
+# these over and over, and interned strings can be compared by identity
+# (such as in compile()'s cache) instead of character by character.
+for _name, _value in tuple(globals().items()):
+    if _name.isupper() and isinstance(_value, str):
+        globals()[_name] = _sys.intern(_value)
+del _name, _value
+
 
 if __name__ == "__main__":
     import doctest
@@ -1097,4 +1278,15 @@ print(timeit.timeit("group4('cat', 'dog', 'cat', 'dog', 'cat', 'dog', 'cat', 'do
 #50.96271799999522
 #53.6757457999629
 #60.84193440002855
+
+# Re-checked on Python 3.11, since ''.join(('(', *regex_strs, ')')) only
+# allocates one string instead of three. It's still slower for 1, 2, and 6
+# arguments, because building the unpacked tuple costs more than the
+# extra allocations do. So the wrapper functions keep using + concatenation.
+# group1('cat')                                   0.288
+# group4('cat')                                   0.410
+# group1('cat', 'dog')                            0.352
+# group4('cat', 'dog')                            0.419
+# group1('cat', 'dog', 'cat', 'dog', 'cat', 'dog')  0.399
+# group4('cat', 'dog', 'cat', 'dog', 'cat', 'dog')  0.506
 '''
@@ -289,6 +289,20 @@ def test_join():
     assert join() == ''
 
 
+def test_build():
+    assert build() == ''
+    assert build('dog', 'cat', 'moose') == join('dog', 'cat', 'moose')
+    assert build(('dog', ['cat']), 'moose') == 'dogcatmoose'
+    assert build(('(', 'cat', ('(', 'dog', ')'), ('(', 'moose', ')'), ')')) == group('cat', group('dog'), group('moose'))
+    assert build((), [], ['', ()]) == ''
+
+    # Nesting deeper than the recursion limit still works:
+    parts = 'x'
+    for i in range(sys.getrecursionlimit() * 2):
+        parts = ('(', parts, ')')
+    assert build(parts) == '(' * sys.getrecursionlimit() * 2 + 'x' + ')' * sys.getrecursionlimit() * 2
+
+
 def test_esc():
     assert esc(r'hello') == re.escape(r'hello') == 'hello'
 
@@ -297,6 +311,10 @@ def test_esc():
 
     assert esc(r'+') == re.escape(r'+') == r'\+'
 
+    for i in range(0, 1000):
+        assert esc(chr(i)) == re.escape(chr(i))
+    assert esc('foo', '.', 'bar', ' ', '\n') == re.escape('foo.bar \n')
+
 
 def test_compile():
     assert compile('hello') == re.compile('hello')
@@ -317,6 +335,74 @@ def test_compile():
     assert compile('hello', flags=X) == re.compile('hello', re.X)
     assert compile('hello', flags=VERBOSE) == re.compile('hello', re.VERBOSE)
 
+    # Repeat calls return the cached Pattern object:
+    assert compile('hel', 'lo') is compile('hello')
+    assert compile('hello', flags=IGNORECASE) is compile('hello', flags=IGNORECASE)
+    assert compile('hello') is not compile('hello', flags=IGNORECASE)
+    patternObj = compile('hello')
+    compile.cache_clear()
+    assert compile('hello') == patternObj
+
+
+def test_compile_engine():
+    with pytest.raises(ValueError) as excObj:
+        compile('hello', engine='perl')
+
+    assert compile('hello', engine='stdlib') is compile('hello')
+
+
+def test_compile_re2_engine():
+    re2 = pytest.importorskip('re2')
+
+    assert compile('h', 'ello', engine='re2').search('say hello')
+    assert compile('hello', engine='re2') is compile('hello', engine='re2')
+    assert compile('hello', flags=IGNORECASE, engine='re2').search('HELLO')
+    assert compile('^b', flags=MULTILINE, engine='re2').search('a\nb')
+    assert compile('a.b', flags=DOTALL, engine='re2').search('a\nb')
+
+    # RE2's character classes and word boundaries are ASCII-only, and $
+    # doesn't match before a trailing newline, unlike the re module:
+    assert compile(DIGIT, engine='re2').match('\u0663') is None  # ARABIC-INDIC DIGIT THREE
+    assert compile(WORD, engine='re2').match('\u00e9') is None  # LATIN SMALL LETTER E WITH ACUTE
+    assert compile(WHITESPACE, engine='re2').match('\u2003') is None  # EM SPACE
+    assert compile(BOUNDARY, engine='re2').search('\u00e9') is None
+    assert compile('a$', engine='re2').search('a\n') is None
+    assert compile('a$').search('a\n')
+
+    # Patterns that RE2 can't compile fall back to the re module:
+    with pytest.warns(UserWarning, match=r"^RE2 cannot compile this pattern \(invalid escape sequence: \\1\)"):
+        patternObj = compile(group('a'), BACK_1, engine='re2')
+    assert isinstance(patternObj, re.Pattern)
+    assert patternObj.search('aa')
+    with pytest.warns(UserWarning):
+        patternObj = compile('a', flags=VERBOSE, engine='re2')
+    assert isinstance(patternObj, re.Pattern)
+
+
+def test_compile_pcre_jit_engine():
+    pcre2 = pytest.importorskip('pcre2')
+
+    assert compile('h', 'ello', engine='pcre-jit').search('say hello')
+    assert compile('hello', engine='pcre-jit') is compile('hello', engine='pcre-jit')
+    assert compile('hello', flags=IGNORECASE, engine='pcre-jit').search('HELLO')
+    assert compile('^b', flags=MULTILINE, engine='pcre-jit').search('a\nb')
+    assert compile('a.b', flags=DOTALL, engine='pcre-jit').search('a\nb')
+    assert compile(group('a'), BACK_1, engine='pcre-jit').search('aa')
+    assert compile('kitty', positive_lookahead('cat'), engine='pcre-jit').search('kittycat')
+    assert compile(DIGIT, engine='pcre-jit').match('\u0663')  # ARABIC-INDIC DIGIT THREE
+    assert compile(DIGIT, flags=ASCII, engine='pcre-jit').match('\u0663') is None
+    assert compile('a b', flags=VERBOSE, engine='pcre-jit').match('ab')
+    assert compile(group('a'), engine='pcre-jit').sub(r'<\1>', 'xax') == 'x<a>x'
+    assert compile('hello', engine='pcre-jit').jit
+
+    # Flags and patterns that PCRE2 doesn't support fall back to the re module:
+    with pytest.warns(UserWarning):
+        patternObj = compile('a', flags=DEBUG, engine='pcre-jit')
+    assert isinstance(patternObj, re.Pattern)
+    with pytest.warns(UserWarning):
+        patternObj = compile(r'\N{LATIN SMALL LETTER A}', engine='pcre-jit')
+    assert isinstance(patternObj, re.Pattern)
+
 
 def test_group():
     assert group('cat') == '(cat)'
@@ -358,8 +444,19 @@ def test_named_group():
         named_group('2', 'hello')  # Starts with number.
     with pytest.raises(ValueError) as excObj:
         named_group('!', 'hello')  # Invalid character.
+    with pytest.raises(ValueError) as excObj:
+        named_group('foo!', 'hello')  # Invalid character after valid ones.
+    with pytest.raises(ValueError) as excObj:
+        named_group('foo bar', 'hello')  # Contains a space.
+    with pytest.raises(ValueError) as excObj:
+        named_group('a\u00b2', 'hello')  # Superscript two is a digit for \w but not valid in identifiers.
+    with pytest.raises(ValueError) as excObj:
+        named_group('\u00b2a', 'hello')
 
     assert named_group('foo', 'cat') == '(?P<foo>cat)'
+    assert named_group('_foo2', 'cat') == '(?P<_foo2>cat)'
+    assert named_group('a\u00b7b', 'cat') == '(?P<a\u00b7b>cat)'  # Middle dot is valid after the first character.
+    assert compile(named_group('a\u00b7b', 'cat')).match('cat').group('a\u00b7b') == 'cat'
     assert named_group('foo', 'cat', 'dog', 'moose') == '(?P<foo>catdogmoose)'
 
 
@@ -392,6 +489,14 @@ def test_either():
 
     assert either('cat', 'dog', 'moose') == 'cat|dog|moose'
     assert either('cat', '', 'moose') == 'cat|moose'
+
+    # Only blank strings are skipped. Other values still fail:
+    with pytest.raises(TypeError) as excObj:
+        either('cat', None)
+    with pytest.raises(TypeError) as excObj:
+        either('cat', 0)
+    with pytest.raises(TypeError) as excObj:
+        group_either('cat', None)
     assert group(either('cat', 'dog', 'moose')) == '(cat|dog|moose)'
 
 
@@ -415,6 +520,31 @@ def test_exactly():
     assert exactly(0, 'cat') == 'cat{0}'
 
 
+def test_quantity_arguments():
+    class IntLike:
+        def __index__(self):
+            return 3
+
+    # Int-like types that support __index__() are accepted:
+    assert exactly(IntLike(), 'cat') == 'cat{3}'
+    assert between(1, IntLike(), 'cat') == 'cat{1,3}'
+    assert group_at_least(IntLike(), 'cat') == '(cat){3,}'
+    assert at_most(IntLike(), 'cat') == 'cat{,3}'
+
+    # Bools are not accepted, even though bool is a subclass of int:
+    with pytest.raises(TypeError) as excObj:
+        exactly(True, 'cat')
+    with pytest.raises(TypeError) as excObj:
+        between(0, True, 'cat')
+    with pytest.raises(TypeError) as excObj:
+        noncap_group_at_most(False, 'cat')
+
+    # Rejected bools don't affect the output for the ints they're equal to:
+    assert exactly(1, 'cat') == 'cat{1}'
+    assert between(0, 1, 'cat') == 'cat{0,1}'
+    assert noncap_group_at_most(0, 'cat') == '(?:cat){,0}'
+
+
 def test_between():
     with pytest.raises(TypeError) as excObj:
         between('forty two', 1, 'cat')
@@ -598,18 +728,26 @@ def test_optional_noncap_group():
 
 
 def test_group_either():
-    assert group_either() == '()'
-    assert group_either('') == '()'
-    assert group_either('', '') == '()'
+    with pytest.raises(ValueError) as excObj:
+        group_either()
+    with pytest.raises(ValueError) as excObj:
+        group_either('')
+    with pytest.raises(ValueError) as excObj:
+        group_either('', '')
+
     assert group_either('cat', 'dog', 'moose') == '(cat|dog|moose)'
     assert group_either('cat', '', 'moose') == '(cat|moose)'
     assert group_either('cat', 'dog', 'moose') == '(cat|dog|moose)'
 
 
 def test_noncap_group_either():
-    assert noncap_group_either() == '(?:)'
-    assert noncap_group_either('') == '(?:)'
-    assert noncap_group_either('', '') == '(?:)'
+    with pytest.raises(ValueError) as excObj:
+        noncap_group_either()
+    with pytest.raises(ValueError) as excObj:
+        noncap_group_either('')
+    with pytest.raises(ValueError) as excObj:
+        noncap_group_either('', '')
+
     assert noncap_group_either('cat', 'dog', 'moose') == '(?:cat|dog|moose)'
     assert noncap_group_either('cat', '', 'moose') == '(?:cat|moose)'
     assert noncap_group_either('cat', 'dog', 'moose') == '(?:cat|dog|moose)'
@@ -1055,6 +1193,7 @@ def test_ascii_nonnumeric():
 
 
 def test_number_pattern():
+    assert NUMBER == r'(?:\+|-)?(?:(?:\d{1,3}(?:,\d{3})+)|\d+)(?:\.\d+)?'
     assert compile(NUMBER).match('') is None
     for i in range(65, 91):  # A-Z
         assert compile(NUMBER).match(chr(i)) is None
@@ -1081,6 +1220,7 @@ def test_number_pattern():
 
 
 def test_euro_number_pattern():
+    assert EURO_NUMBER == r'(?:\+|-)?(?:(?:\d{1,3}(?:\.\d{3})+)|\d+)(?:,\d+)?'
     for i in range(65, 91):  # A-Z
         assert compile(EURO_NUMBER).match(chr(i)) is None
     for i in range(97, 123):  # a-z
@@ -1254,6 +1394,21 @@ def test_nonnumeric_character_class():
             assert compile(NONNUMERIC).match(chr(i)) is None
 
 
+def test_patterns():
+    assert patterns.LETTER is patterns.LETTER
+    assert patterns.LETTER.pattern == LETTER
+    assert patterns.NONNUMERIC.pattern == NONNUMERIC
+    assert patterns.NUMBER.match('-1,234.00')
+    assert patterns.HEXADECIMAL.match('f')
+    assert patterns.NONHEXADECIMAL.match('g')
+    assert 'UPPERCASE' in dir(patterns)
+
+    with pytest.raises(AttributeError) as excObj:
+        patterns.DIGIT
+    with pytest.raises(AttributeError) as excObj:
+        patterns.compile
+
+
 def test_constants():
     assert DIGIT == r'\d'
     assert WORD == r'\w'
@@ -1422,3 +1577,11 @@ def test_optional_possessive():
 
 if __name__ == "__main__":
     pytest.main()
+
+
+def test_star_import_namespace():
+    namespace = {}
+    exec('from humre import *', namespace)
+    for moduleName in ('sys', 'operator', 'warnings'):
+        assert moduleName not in namespace
+    assert 'compile' in namespace and 'DIGIT' in namespace